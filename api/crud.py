@@ -1,5 +1,7 @@
+from typing import List
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import text, or_
+from sqlalchemy import text, or_, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from fastapi import HTTPException
 from datetime import datetime
 
@@ -185,15 +187,59 @@ def get_all_clients_with_notification_settings(db: Session):
         models.ClientNotificationSettings
     ).all()
 
+def get_or_create_ai_provider_id(db: Session, name: str):
+    """Resolve an AI provider name to its ai_providers id, adding the provider if it is new"""
+    if not name:
+        return None
+    provider_id = db.query(models.AIProvider.id).filter(models.AIProvider.name == name).scalar()
+    if provider_id is None:
+        # Concurrent creates may add the same provider, the unique name decides and both re-select.
+        # Only inserted on a miss, every conflicting insert would use up a SMALLSERIAL value
+        db.execute(pg_insert(models.AIProvider).values(name=name).on_conflict_do_nothing(index_elements=['name']))
+        provider_id = db.query(models.AIProvider.id).filter(models.AIProvider.name == name).scalar()
+    return provider_id
+
+def _normalize_upgrade_priority(priority):
+    """Map a free-form priority onto the ai_upgrade_priority enum, anything outside its vocabulary is stored as unknown"""
+    priority = (priority or '').strip().lower()
+    return priority if priority in models.AI_UPGRADE_PRIORITIES else None
+
+def _protocol_update_values(db: Session, protocol_update: schemas.ProtocolUpdatesCreate, exclude=frozenset()):
+    """Column values for a new protocol update, with the provider name swapped for its id"""
+    values = protocol_update.model_dump(exclude={'ai_provider', *exclude})
+    values['ai_upgrade_priority'] = _normalize_upgrade_priority(protocol_update.ai_upgrade_priority)
+    values['ai_provider_id'] = get_or_create_ai_provider_id(db, protocol_update.ai_provider)
+    return values
+
 def create_protocol_updates(
     db: Session, protocol_update: schemas.ProtocolUpdatesCreate
 ):
-    db_protocol_update = models.ProtocolUpdates(**protocol_update.model_dump())
+    db_protocol_update = models.ProtocolUpdates(**_protocol_update_values(db, protocol_update))
     db.add(db_protocol_update)
     db.commit()
     db.refresh(db_protocol_update)
     return db_protocol_update
 
+def create_protocol_updates_bulk(
+    db: Session, protocol_updates: List[schemas.ProtocolUpdatesCreate]
+) -> List[models.ProtocolUpdates]:
+    """Insert several protocol updates with one multi-row INSERT ... RETURNING and a single commit"""
+    if not protocol_updates:
+        return []
+    
+    db_protocol_updates = db.scalars(
+        insert(models.ProtocolUpdates).returning(models.ProtocolUpdates),
+        [_protocol_update_values(db, update, exclude={'id'}) for update in protocol_updates]
+    ).all()
+    ids = [update.id for update in db_protocol_updates]
+    db.commit()
+    
+    # Reload the expired rows in one query instead of one refresh per row
+    return (db.query(models.ProtocolUpdates)
+            .filter(models.ProtocolUpdates.id.in_(ids))
+            .order_by(models.ProtocolUpdates.id)
+            .all())
+
 def patch_protocol_updates(db: Session, protocol: schemas.ProtocolUpdates):
     protocol_update = db.query(models.ProtocolUpdates).filter(models.ProtocolUpdates.id == int(protocol.id)).first()
     
@@ -818,10 +864,11 @@ def update_protocol_update_ai_analysis(db: Session, protocol_update_id: int, ana
     
     # Update AI analysis fields
     protocol_update.ai_summary = analysis_result.summary
-    protocol_update.ai_key_changes = analysis_result.key_changes
-    protocol_update.ai_breaking_changes = analysis_result.breaking_changes
+    # Text array columns, the model occasionally returns non-string list items
+    protocol_update.ai_key_changes = [str(c) for c in analysis_result.key_changes] if analysis_result.key_changes is not None else None
+    protocol_update.ai_breaking_changes = [str(c) for c in analysis_result.breaking_changes] if analysis_result.breaking_changes is not None else None
     protocol_update.ai_security_updates = analysis_result.security_updates
-    protocol_update.ai_upgrade_priority = analysis_result.upgrade_priority
+    protocol_update.ai_upgrade_priority = _normalize_upgrade_priority(analysis_result.upgrade_priority)
     protocol_update.ai_risk_assessment = analysis_result.risk_assessment
     protocol_update.ai_technical_summary = analysis_result.technical_summary
     protocol_update.ai_executive_summary = analysis_result.executive_summary
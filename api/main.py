@@ -80,6 +80,11 @@ async def lifespan(app: FastAPI):
     """Application lifespan context manager for startup and shutdown events"""
     # Startup
     logger.info(f"=== APPLICATION STARTUP ===")
+    
+    # Start the webhook delivery workers before anything can queue notifications
+    from services.notification_service import notification_service
+    notification_service.start_workers()
+    
     db = next(get_db())
     try:
         # Auto-start background poller if enabled
@@ -142,6 +147,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown (if needed)
     logger.info(f"=== APPLICATION SHUTDOWN ===")
+    
+    # Deliver queued notifications, then close the shared webhook HTTP client
+    await notification_service.stop_workers()
+    await notification_service.aclose()
 
 logger.info(f"=== CREATING FASTAPI APP ===")
 app = FastAPI(
@@ -189,6 +198,11 @@ def get_db():
         logger.debug("Closing database connection")
         db.close()
 
+def get_notification_service():
+    """Return the shared notification service, so routes reuse its HTTP pool and workers"""
+    from services.notification_service import notification_service
+    return notification_service
+
 
 api_key_header = APIKeyHeader(name="x-api-key", auto_error=False)
 
@@ -750,6 +764,14 @@ async def scan_protocol_snapshots(
         total_manifests_checked = 0
         found_any_manifests = False
         new_snapshots = []
+        
+        # ETags of already indexed manifests, used to skip re-downloading unchanged ones
+        known_etags = {
+            snapshot_id: etag
+            for snapshot_id, etag in db.query(
+                models.SnapshotIndex.snapshot_id, models.SnapshotIndex.etag
+            ).filter(models.SnapshotIndex.protocol_id == protocol_id)
+        }
 
         # List all top-level directories that start with any of our protocol prefixes
         paginator = client.get_paginator("list_objects_v2")
@@ -806,11 +828,27 @@ async def scan_protocol_snapshots(
                                     total_manifests_checked += 1
                                     logger.info(f"Looking for manifest at: {manifest_path}")
 
+                                    # Get the backup version from the version directory
+                                    version_num = version_dir.rstrip("/").split("/")[-1]
+                                    snapshot_key = f"{protocol_dir}{version_num}"
+                                    get_kwargs = {}
+                                    if known_etags.get(snapshot_key):
+                                        get_kwargs["IfNoneMatch"] = known_etags[snapshot_key]
+
                                     try:
                                         # Try to get the manifest file
-                                        response = client.get_object(
-                                            Bucket=config.bucket_name, Key=manifest_path
-                                        )
+                                        try:
+                                            response = client.get_object(
+                                                Bucket=config.bucket_name, Key=manifest_path, **get_kwargs
+                                            )
+                                        except client.exceptions.ClientError as e:
+                                            if e.response.get("ResponseMetadata", {}).get("HTTPStatusCode") != 304:
+                                                raise
+                                            # Manifest unchanged since it was indexed, keep it out of cleanup
+                                            found_any_manifests = True
+                                            snapshot_info[snapshot_key] = {"unchanged": True}
+                                            logger.info(f"Manifest unchanged since last scan: {manifest_path}")
+                                            continue
                                         found_any_manifests = True
                                         logger.info(f"Found manifest: {manifest_path}")
 
@@ -901,11 +939,7 @@ async def scan_protocol_snapshots(
                                             else "v1"
                                         )
 
-                                        # Get the backup version from the version directory
-                                        version_num = version_dir.rstrip("/").split("/")[-1]
-
                                         # Create snapshot record in database
-                                        snapshot_key = f"{protocol_dir}{version_num}"
                                         snapshot_metadata = {
                                             "version": int(version_num),
                                             "manifest_path": manifest_path,
@@ -940,6 +974,7 @@ async def scan_protocol_snapshots(
                                             "manifest_path": manifest_path,
                                             "paths": paths,
                                             "created_at": response["LastModified"],
+                                            "etag": response.get("ETag"),
                                             "metadata": snapshot_metadata
                                         }
                                         logger.info(
@@ -975,6 +1010,9 @@ async def scan_protocol_snapshots(
         logger.info(f"Found {len(snapshot_info)} total snapshots to process")
 
         for snapshot_key, info in snapshot_info.items():
+            if info.get("unchanged"):
+                continue
+
             # Check if this snapshot is already indexed
             existing = crud.get_snapshot_by_id(db, snapshot_key, protocol_id)
             if existing:
@@ -983,6 +1021,7 @@ async def scan_protocol_snapshots(
                 existing.file_count = len(info["paths"])
                 existing.total_size = info["metadata"].get("total_size_bytes", 0)
                 existing.snapshot_metadata = info["metadata"]
+                existing.etag = info["etag"]
                 existing.indexed_at = datetime.utcnow()
                 
                 # Debug logging to check metadata content
@@ -1012,6 +1051,7 @@ async def scan_protocol_snapshots(
                 total_size=info["metadata"].get("total_size_bytes", 0),
                 created_at=info["created_at"],
                 snapshot_metadata=info["metadata"],  # Use the pre-built metadata
+                etag=info["etag"],
             )
             new_snapshots.append(crud.create_snapshot_index(db, snapshot))
 
@@ -1290,6 +1330,43 @@ async def list_snapshot_files(
         )
 
 
+@app.get("/protocols/{protocol_id}/snapshot-manifest/{snapshot_id:path}",
+   tags=["Snapshots"],
+   summary="Get full snapshot manifest"
+)
+async def get_snapshot_manifest(
+    protocol_id: int,
+    snapshot_id: str,
+    api_key: str = Security(get_api_key),
+    db: Session = Depends(get_db),
+):
+    """Stream the full manifest of a snapshot from S3, only a summary is stored in the database."""
+    from urllib.parse import unquote
+    decoded_snapshot_id = unquote(snapshot_id)
+    
+    snapshot = crud.get_snapshot_by_id(db, decoded_snapshot_id, protocol_id)
+    if not snapshot:
+        raise HTTPException(status_code=404, detail="Snapshot not found")
+
+    client = get_s3_client(db)
+    config = crud.get_s3_config(db)
+    
+    try:
+        response = client.get_object(
+            Bucket=config.bucket_name, Key=snapshot.index_file_path
+        )
+    except client.exceptions.NoSuchKey:
+        raise HTTPException(status_code=404, detail="Snapshot manifest not found in storage")
+    except ClientError as e:
+        logger.error(f"Error fetching manifest {snapshot.index_file_path}: {str(e)}")
+        raise HTTPException(status_code=502, detail=f"Error fetching snapshot manifest: {str(e)}")
+
+    return StreamingResponse(
+        response["Body"].iter_chunks(),
+        media_type="application/json"
+    )
+
+
 # Snapshot Prefix Management endpoints
 @app.get(
     "/protocols/{protocol_id}/snapshot-prefixes",
@@ -2979,13 +3056,11 @@ def get_ai_feedback_endpoint(
 async def test_webhook_endpoint(
     webhook_test: schemas.WebhookTest,
     admin_user: models.Users = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    notification_service=Depends(get_notification_service)
 ):
     """Test a webhook configuration"""
     with timer("test_webhook"):
-        from services.notification_service import NotificationService
-        
-        notification_service = NotificationService()
         success = await notification_service.test_webhook(
             webhook_test.webhook_type,
             webhook_url=webhook_test.webhook_url,
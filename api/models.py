@@ -1,10 +1,15 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime, TIMESTAMP, Float, LargeBinary, JSON, BigInteger, Table
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime, TIMESTAMP, Float, LargeBinary, JSON, BigInteger, Table, Index, Enum, SmallInteger
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from pydantic import BaseModel
 from typing import Union
 from database import Base
 from datetime import datetime
 from sqlalchemy.schema import UniqueConstraint
+from sqlalchemy.sql import text
+
+# Values of the ai_upgrade_priority_enum type
+AI_UPGRADE_PRIORITIES = ('low', 'medium', 'high', 'critical')
 
 # Association table for Protocol-Client many-to-many relationship
 protocol_clients = Table(
@@ -13,7 +18,9 @@ protocol_clients = Table(
     Column('protocol_id', Integer, ForeignKey('protocols.id', ondelete='CASCADE'), primary_key=True),
     Column('client_id', Integer, ForeignKey('clients.id', ondelete='CASCADE'), primary_key=True),
     Column('created_at', DateTime, nullable=False, default=datetime.utcnow),
-    Column('is_primary', Boolean, nullable=False, default=False)  # Flag for primary client
+    Column('is_primary', Boolean, nullable=False, default=False, server_default=text('false')),  # Flag for primary client
+    # The primary key leads with protocol_id, so only client_id lookups need an index
+    Index('ix_protocol_clients_client_id', 'client_id')
 )
 
 
@@ -41,17 +48,17 @@ class ProtocolUpdates(Base):
     
     # AI Analysis fields
     ai_summary = Column(String, nullable=True)
-    ai_key_changes = Column(JSON, nullable=True)  # Array of key changes
-    ai_breaking_changes = Column(JSON, nullable=True)  # Array of breaking changes
-    ai_security_updates = Column(JSON, nullable=True)  # Array of security updates
-    ai_upgrade_priority = Column(String, nullable=True)  # critical, high, medium, low
+    ai_key_changes = Column(ARRAY(String), nullable=True)  # Array of key changes
+    ai_breaking_changes = Column(ARRAY(String), nullable=True)  # Array of breaking changes
+    ai_security_updates = Column(JSONB, nullable=True)  # Array of security updates
+    ai_upgrade_priority = Column(Enum(*AI_UPGRADE_PRIORITIES, name='ai_upgrade_priority_enum'), nullable=True)
     ai_risk_assessment = Column(String, nullable=True)
     ai_technical_summary = Column(String, nullable=True)
     ai_executive_summary = Column(String, nullable=True)
     ai_estimated_impact = Column(String, nullable=True)
     ai_confidence_score = Column(Float, nullable=True)  # 0.0 to 1.0
     ai_analysis_date = Column(DateTime, nullable=True)
-    ai_provider = Column(String, nullable=True)  # openai, anthropic, local
+    ai_provider_id = Column(SmallInteger, ForeignKey('ai_providers.id'), nullable=True)
     
     # Enhanced hard fork fields
     ai_hard_fork_details = Column(String, nullable=True)
@@ -61,6 +68,23 @@ class ProtocolUpdates(Base):
     
     # Relationships
     client_entity = relationship('Client', back_populates='updates', lazy='select')
+    ai_provider_entity = relationship('AIProvider', lazy='selectin')
+
+    @property
+    def ai_provider(self):
+        """Provider name, resolved through the ai_providers lookup"""
+        return self.ai_provider_entity.name if self.ai_provider_entity else None
+
+    __table_args__ = (
+        Index('ix_protocol_tracking_client_id', 'client_id', postgresql_where=client_id.isnot(None)),
+        Index('idx_protocol_tracking_hard_fork', 'hard_fork'),
+        Index('idx_protocol_tracking_activation_date', 'activation_date'),
+        Index('idx_pt_priority_date', ai_upgrade_priority, ai_analysis_date.desc()),
+        Index('idx_pt_ai_analysis_date_brin', 'ai_analysis_date', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        Index('idx_pt_ai_key_changes_gin', 'ai_key_changes', postgresql_using='gin'),
+        Index('idx_pt_ai_breaking_changes_gin', 'ai_breaking_changes', postgresql_using='gin'),
+        Index('idx_pt_ai_security_updates_gin', 'ai_security_updates', postgresql_using='gin', postgresql_ops={'ai_security_updates': 'jsonb_path_ops'}),
+    )
 
 
 class Protocol(Base):
@@ -201,6 +225,7 @@ class SnapshotIndex(Base):
     created_at = Column(DateTime, nullable=False)  # When the snapshot was created
     indexed_at = Column(DateTime, nullable=False, default=datetime.utcnow)  # When we indexed it
     snapshot_metadata = Column(JSON, nullable=True)  # Additional snapshot metadata
+    etag = Column(String, nullable=True)  # ETag of the manifest when it was indexed
 
     # Relationships
     protocol = relationship('Protocol', back_populates='snapshots')
@@ -289,6 +314,13 @@ class ClientNotificationSettings(Base):
     )
 
 
+class AIProvider(Base):
+    __tablename__ = "ai_providers"
+
+    id = Column(SmallInteger, primary_key=True)
+    name = Column(String(50), unique=True, nullable=False)  # openai, anthropic, local
+
+
 class AIConfig(Base):
     __tablename__ = "ai_config"
 
@@ -310,10 +342,10 @@ class AIAnalysisFeedback(Base):
     id = Column(Integer, primary_key=True, index=True)
     protocol_update_id = Column(Integer, ForeignKey('protocol_tracking.id', ondelete='CASCADE'), nullable=False)
     user_id = Column(Integer, ForeignKey('Users.id', ondelete='CASCADE'), nullable=False)
-    rating = Column(Integer, nullable=False)  # 1-5 stars
+    rating = Column(SmallInteger, nullable=False)  # 1-5 stars
     feedback_text = Column(String, nullable=True)
-    helpful_aspects = Column(JSON, nullable=True)  # Array of what was helpful
-    improvement_suggestions = Column(JSON, nullable=True)  # Array of suggestions
+    helpful_aspects = Column(JSONB, nullable=True)  # Array of what was helpful
+    improvement_suggestions = Column(JSONB, nullable=True)  # Array of suggestions
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     
     # Relationships
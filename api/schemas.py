@@ -308,6 +308,7 @@ class SnapshotIndexBase(BaseModel):
     total_size: int
     created_at: datetime
     snapshot_metadata: Optional[Dict[str, Any]] = None
+    etag: Optional[str] = None
 
 class SnapshotIndexCreate(SnapshotIndexBase):
     pass
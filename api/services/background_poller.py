@@ -256,7 +256,11 @@ class BackgroundPollerService:
                 
                 logger.info(f"Processing {len(items_to_process)} items for {client.name}")
                 
-                # Process all items and create protocol updates
+                # Updates for this client are collected and inserted in one batch
+                pending_updates = []
+                pending_tags = set()
+                
+                # Process all items and build protocol updates
                 for item in items_to_process:
                     # Handle both dict and object formats
                     tag_name = item.get('tag_name') if isinstance(item, dict) else item.tag_name
@@ -267,7 +271,7 @@ class BackgroundPollerService:
                     draft = item.get('draft') if isinstance(item, dict) else getattr(item, 'draft', False)
                     prerelease = item.get('prerelease') if isinstance(item, dict) else getattr(item, 'prerelease', False)
                     
-                    if not tag_name:
+                    if not tag_name or tag_name in pending_tags:
                         continue
                         
                     # Check if we already have this release (with proper error handling)
@@ -300,11 +304,15 @@ class BackgroundPollerService:
                         is_prerelease=prerelease,
                         is_closed=True
                     )
-                    
-                    # Create the protocol update
-                    new_update = crud.create_protocol_updates(db, update_data)
-                    total_updates += 1
-                    logger.info(f"Created update for {client.name}: {tag_name}")
+                    pending_updates.append(update_data)
+                    pending_tags.add(tag_name)
+                
+                # Create all new protocol updates for this client at once
+                new_updates = self.protocol_service.create_protocol_updates_bulk(db, pending_updates) if pending_updates else []
+                total_updates += len(new_updates)
+                
+                for new_update in new_updates:
+                    logger.info(f"Created update for {client.name}: {new_update.tag}")
                     
                     # Run AI analysis on the new update if enabled
                     # Only analyze recent updates (last 30 days) and limit per poll cycle
@@ -320,12 +328,13 @@ class BackgroundPollerService:
                             await self._analyze_update_with_ai(db, new_update, is_manual_poll=False)
                     else:
                         if ai_analyses_queued >= max_ai_analyses:
-                            logger.debug(f"Skipping AI analysis for {client.name}: {tag_name} (AI analysis limit reached)")
+                            logger.debug(f"Skipping AI analysis for {client.name}: {new_update.tag} (AI analysis limit reached)")
                         else:
-                            logger.debug(f"Skipping AI analysis for {client.name}: {tag_name} (older than 30 days)")
-                    
-                    # Send notifications for this new update
-                    await self._send_update_notification(db, client, new_update)
+                            logger.debug(f"Skipping AI analysis for {client.name}: {new_update.tag} (older than 30 days)")
+                
+                # Send one batched notification for all new updates of this client
+                if new_updates:
+                    await self._send_update_notifications(db, client, new_updates)
                     
             except Exception as e:
                 error_msg = f"Error polling {client.name}: {str(e)}"
@@ -440,21 +449,27 @@ class BackgroundPollerService:
             logger.error(f"AI analysis error for update {protocol_update.id}: {e}")
             # Don't raise the exception to avoid breaking the polling cycle
     
-    async def _send_update_notification(self, db: Session, client, protocol_update):
-        """Send notification for a new protocol update"""
+    async def _send_update_notifications(self, db: Session, client, protocol_updates):
+        """Send one batched notification for the new protocol updates of a client"""
         try:
-            # Check if release is within the last 7 days to avoid spam when adding new clients
+            # Only notify releases within the last 7 days to avoid spam when adding new clients
             from datetime import datetime, timedelta, timezone
             seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
             
-            # Convert release date to UTC timezone-aware datetime if needed
-            release_date = protocol_update.date
-            if release_date.tzinfo is None:
-                # Assume UTC if no timezone info
-                release_date = release_date.replace(tzinfo=timezone.utc)
+            recent_updates = []
+            for protocol_update in protocol_updates:
+                # Convert release date to UTC timezone-aware datetime if needed
+                release_date = protocol_update.date
+                if release_date.tzinfo is None:
+                    # Assume UTC if no timezone info
+                    release_date = release_date.replace(tzinfo=timezone.utc)
+                
+                if release_date < seven_days_ago:
+                    logger.debug(f"Skipping notification for {client.name} release {protocol_update.tag} - older than 7 days ({release_date})")
+                    continue
+                recent_updates.append(protocol_update)
             
-            if release_date < seven_days_ago:
-                logger.debug(f"Skipping notification for {client.name} release {protocol_update.tag} - older than 7 days ({release_date})")
+            if not recent_updates:
                 return
             
             # Get notification configuration
@@ -469,17 +484,23 @@ class BackgroundPollerService:
                 logger.debug(f"Notifications disabled for client {client.name}")
                 return
             
-            # Import notification service
-            from .notification_service import NotificationService
-            notification_service = NotificationService()
+            # Import the shared notification service
+            from .notification_service import notification_service
             
             # Prepare notification data
             client_name = client.name or client.client or 'Unknown'
-            tag = protocol_update.tag
-            title = protocol_update.title or f"New release {tag}"
-            url = protocol_update.url or protocol_update.github_url
-            notes = protocol_update.notes
-            is_prerelease = protocol_update.is_prerelease or False
+            updates = [
+                {
+                    'client_name': client_name,
+                    'tag': protocol_update.tag,
+                    'title': protocol_update.title or f"New release {protocol_update.tag}",
+                    'url': protocol_update.url or protocol_update.github_url,
+                    'notes': protocol_update.notes,
+                    'is_prerelease': protocol_update.is_prerelease or False
+                }
+                for protocol_update in recent_updates
+            ]
+            tags = ", ".join(update['tag'] for update in updates)
             
             # Prepare webhook configurations (support both new multiple URLs and legacy single URLs)
             discord_urls = []
@@ -520,33 +541,19 @@ class BackgroundPollerService:
                         'headers': notification_config.generic_headers or {}
                     })
             
-            # Send notifications
-            results = await notification_service.send_protocol_update_notifications(
-                client_name=client_name,
-                tag=tag,
-                title=title,
-                url=url,
-                notes=notes,
-                is_prerelease=is_prerelease,
-                # New multiple URL support
+            # Hand off to the notification workers, the poller does not wait on webhook round trips
+            await notification_service.enqueue_batch_protocol_updates(
+                updates,
                 discord_webhook_urls=discord_urls if discord_urls else None,
                 slack_webhook_urls=slack_urls if slack_urls else None,
                 telegram_bot_token=telegram_config['bot_token'] if telegram_config else None,
                 telegram_chat_ids=telegram_config['chat_ids'] if telegram_config else None,
                 generic_webhook_configs=generic_configs if generic_configs else None
             )
-            
-            # Log results
-            successful_notifications = [k for k, v in results.items() if v]
-            if successful_notifications:
-                logger.info(f"Successfully sent notifications for {client_name} {tag}: {', '.join(successful_notifications)}")
-            
-            failed_notifications = [k for k, v in results.items() if not v]
-            if failed_notifications:
-                logger.warning(f"Failed to send notifications for {client_name} {tag}: {', '.join(failed_notifications)}")
+            logger.info(f"Queued notifications for {client_name} {tags}")
                 
         except Exception as e:
-            logger.error(f"Error sending notification for {client.name} {protocol_update.tag}: {e}")
+            logger.error(f"Error sending notifications for {client.name}: {e}")
 
 
 # Global instance
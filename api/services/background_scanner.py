@@ -4,20 +4,100 @@ Background snapshot scanner service that runs on the server
 
 import asyncio
 import logging
+import orjson
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from botocore.exceptions import ClientError
 from sqlalchemy.orm import Session
 import models, schemas, crud
-from database import get_db
+from database import SessionLocal
 from utils.formatting import format_bytes, format_number_with_commas
 from main import get_s3_client
 
 logger = logging.getLogger(__name__)
 
+# Manifests list their data as chunks, each written to one or more file destinations
+# ({"chunks": [{"destinations": [{"path": ..., "size": ...}]}]}), the shape list_snapshot_files reads.
+# A file spanning several chunks has a destination in each, so files are counted by distinct path
+MANIFEST_SUMMARY_EXPRESSION = "SELECT d.path, d.size FROM S3Object[*].chunks[*].destinations[*] d"
+
+# Manifest fields persisted in snapshot_metadata when the full body is read
+MANIFEST_SUMMARY_FIELDS = ("version", "network", "chain_id", "created_at")
+
+# Error codes meaning the backend has no S3 Select at all, e.g. B2, rather than a per-object failure
+SELECT_UNSUPPORTED_ERROR_CODES = frozenset({"NotImplemented", "XNotImplemented", "MethodNotAllowed", "UnsupportedOperation"})
+
+# Seconds stop() waits for a running scan to notice the stop request before cancelling it
+STOP_TIMEOUT_SECONDS = 30
+
+
+def _load_existing_snapshots(db: Session, protocol_id: int) -> Dict[str, str]:
+    """Return {snapshot_id: index_file_path} for every snapshot already indexed for a protocol"""
+    rows = db.query(models.SnapshotIndex.snapshot_id, models.SnapshotIndex.index_file_path).filter(
+        models.SnapshotIndex.protocol_id == protocol_id
+    ).all()
+    return {snapshot_id: index_file_path for snapshot_id, index_file_path in rows}
+
+
+def _summarize_destinations(destinations: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+    """Return (file_count, total_size) for manifest chunk destinations, total_size being the bytes written to files"""
+    paths = set()
+    total_size = 0
+    for destination in destinations:
+        if "path" in destination:
+            paths.add(destination["path"])
+        total_size += destination.get("size") or 0
+    return len(paths), total_size
+
+
+def _summarize_manifest_files(manifest_json: Dict[str, Any]) -> Tuple[int, int]:
+    """Return (file_count, total_size) for a parsed manifest body"""
+    return _summarize_destinations(
+        destination
+        for chunk in manifest_json.get("chunks", [])
+        for destination in chunk.get("destinations", [])
+    )
+
+
+def _version_sort_key(snapshot_id: str) -> Tuple[int, int, str]:
+    """Order version directory names numerically when they are integers, lexically otherwise"""
+    if snapshot_id.isdigit():
+        return (1, int(snapshot_id), snapshot_id)
+    return (0, 0, snapshot_id)
+
+
+def _start_after_version(protocol_dir: str, last_indexed: str) -> str:
+    """Return a StartAfter key that lists every version directory newer than last_indexed
+
+    S3 lists keys lexically. Non-numeric and zero-padded ids list in the order they compare in,
+    so listing resumes right after last_indexed. Unpadded integers don't ("10/" sorts before "9/"),
+    so listing resumes just below the lexically smallest id a newer version can have: the next
+    integer, or the next power of ten once the digit count grows.
+    """
+    if not last_indexed.isdigit() or (len(last_indexed) > 1 and last_indexed.startswith("0")):
+        return f"{protocol_dir}{last_indexed}/"
+    smallest_newer = min(str(int(last_indexed) + 1), "1" + "0" * len(last_indexed))
+    return f"{protocol_dir}{smallest_newer}"
+
+
+def _persist(db: Session, protocol_id: int, new_rows: List[models.SnapshotIndex]) -> int:
+    """Insert the newly discovered snapshot index rows for a protocol in a single commit"""
+    if new_rows:
+        db.bulk_save_objects(new_rows)
+    db.commit()
+    logger.debug(f"Persisted {len(new_rows)} new snapshot indexes for protocol {protocol_id}")
+    return len(new_rows)
+
+
 class BackgroundScannerService:
-    def __init__(self):
+    def __init__(self, store_full_metadata: bool = False):
         self.is_running = False
         self.task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
+        # When False, only the file count/size summary of each manifest is fetched
+        # (via S3 Select where supported) instead of the full manifest body
+        self.store_full_metadata = store_full_metadata
+        self._select_supported = True
         
     async def start(self, db: Session) -> Dict[str, Any]:
         """Start the background scanner"""
@@ -42,6 +122,7 @@ class BackgroundScannerService:
         # Start the background task
         try:
             self.is_running = True
+            self._stop_event.clear()
             self.task = asyncio.create_task(self._scanning_loop())
             logger.info(f"Background task created: {self.task}")
             
@@ -70,14 +151,15 @@ class BackgroundScannerService:
         if not self.is_running:
             return {"status": "already_stopped", "message": "Scanner is not running"}
             
-        # Stop the background task
+        # Signal the background task and wait for it to exit, scans check the signal between
+        # protocols and version directories, cancel if one is stuck in a single slow call
         self.is_running = False
+        self._stop_event.set()
         if self.task:
-            self.task.cancel()
             try:
-                await self.task
-            except asyncio.CancelledError:
-                pass
+                await asyncio.wait_for(self.task, timeout=STOP_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                logger.warning(f"Scan did not stop within {STOP_TIMEOUT_SECONDS}s, cancelled it")
         
         logger.info("Background snapshot scanner stopped")
         return {"status": "stopped", "message": "Background snapshot scanner stopped successfully"}
@@ -154,28 +236,29 @@ class BackgroundScannerService:
         logger.info("Background scanning loop started")
         
         while self.is_running:
-            db = None
             try:
-                # Get a fresh database session
-                db = next(get_db())
-                logger.debug("Database session created for scanning loop")
-                
-                # Check if scanner should still be running
-                system_config = crud.get_system_config(db)
-                if not system_config or not system_config.auto_scan_enabled:
-                    logger.info("Auto scanning disabled in system settings, stopping")
-                    self.is_running = False
-                    break
+                # Use a fresh pooled session per cycle, released before idling
+                with SessionLocal() as db:
+                    logger.debug("Database session created for scanning loop")
+                    
+                    # Check if scanner should still be running
+                    system_config = crud.get_system_config(db)
+                    if not system_config or not system_config.auto_scan_enabled:
+                        logger.info("Auto scanning disabled in system settings, stopping")
+                        self.is_running = False
+                        break
+                        
+                    # Run the scan
+                    logger.info("Starting background scan cycle")
+                    await self._run_single_scan(db, stop_event=self._stop_event)
+                    logger.info("Background scan cycle completed")
                     
-                # Run the scan
-                logger.info("Starting background scan cycle")
-                await self._run_single_scan(db)
-                logger.info("Background scan cycle completed")
+                    interval_seconds = system_config.auto_scan_interval_hours * 3600
                 
                 # Wait for the scanning interval
-                interval_seconds = system_config.auto_scan_interval_hours * 3600
                 logger.info(f"Waiting {interval_seconds} seconds until next scan")
-                await asyncio.sleep(interval_seconds)
+                if await self._wait_for_stop(interval_seconds):
+                    break
                 
             except asyncio.CancelledError:
                 logger.info("Scanning loop cancelled")
@@ -185,20 +268,21 @@ class BackgroundScannerService:
                 import traceback
                 logger.error(f"Full traceback: {traceback.format_exc()}")
                 # Wait a bit before retrying on error
-                await asyncio.sleep(300)  # 5 minutes
-            finally:
-                # Ensure database session is properly closed
-                if db:
-                    try:
-                        db.close()
-                        logger.debug("Database session closed")
-                    except Exception as e:
-                        logger.error(f"Error closing database session: {e}")
+                if await self._wait_for_stop(300):  # 5 minutes
+                    break
                 
         logger.info("Background scanning loop ended")
+    
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """Sleep for up to timeout seconds, returning True as soon as stop() is requested"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
         
-    async def _run_single_scan(self, db: Session) -> Dict[str, Any]:
-        """Run a single scanning cycle"""
+    async def _run_single_scan(self, db: Session, stop_event: Optional[asyncio.Event] = None) -> Dict[str, Any]:
+        """Run a single scanning cycle, ending early once stop_event is set"""
         logger.info("Starting snapshot scanning cycle")
         
         # Get all protocols
@@ -216,14 +300,19 @@ class BackgroundScannerService:
         logger.info(f"Found {len(protocols)} protocols to scan")
         
         total_new_snapshots = 0
+        protocols_scanned = 0
         errors = []
         
         for protocol in protocols:
+            if stop_event is not None and stop_event.is_set():
+                logger.info("Stop requested, ending scanning cycle early")
+                break
+            protocols_scanned += 1
             try:
                 logger.info(f"Scanning protocol: {protocol.name}")
                 
                 # Call the existing snapshot scanning logic
-                result = await self._scan_protocol_snapshots(db, protocol)
+                result = await self._scan_protocol_snapshots(db, protocol, stop_event=stop_event)
                 
                 if result["status"] == "success":
                     total_new_snapshots += result.get("new_snapshots", 0)
@@ -238,17 +327,23 @@ class BackgroundScannerService:
                 
         result = {
             "status": "completed",
-            "protocols_scanned": len(protocols),
+            "protocols_scanned": protocols_scanned,
             "new_snapshots": total_new_snapshots,
             "errors": errors,
             "timestamp": datetime.utcnow().isoformat()
         }
         
-        logger.info(f"Scanning cycle completed: {len(protocols)} protocols scanned, {total_new_snapshots} new snapshots, {len(errors)} errors")
+        logger.info(f"Scanning cycle completed: {protocols_scanned} protocols scanned, {total_new_snapshots} new snapshots, {len(errors)} errors")
         return result
     
-    async def _scan_protocol_snapshots(self, db: Session, protocol) -> Dict[str, Any]:
-        """Scan snapshots for a specific protocol (simplified version of the main endpoint)"""
+    async def _scan_protocol_snapshots(self, db: Session, protocol, stop_event: Optional[asyncio.Event] = None) -> Dict[str, Any]:
+        """Scan snapshots for a specific protocol (simplified version of the main endpoint)
+
+        Once stop_event is set the listing stops and the snapshots found so far are persisted.
+        """
+        def stopped() -> bool:
+            return stop_event is not None and stop_event.is_set()
+        
         try:
             client = get_s3_client(db)
             config = crud.get_s3_config(db)
@@ -268,6 +363,9 @@ class BackgroundScannerService:
             else:
                 prefixes_to_scan = [prefix.prefix for prefix in protocol_prefixes]
             
+            # Preload already indexed snapshots off the event loop
+            existing_snapshots = await asyncio.to_thread(_load_existing_snapshots, db, protocol.id)
+            
             # Track snapshots by their full path and stats
             new_snapshots = []
             total_directories = 0
@@ -280,52 +378,106 @@ class BackgroundScannerService:
             
             # Scan each prefix
             for prefix in prefixes_to_scan:
+                if stopped():
+                    break
                 logger.debug(f"Looking for snapshots with prefix: {prefix}")
                 
                 # Get all directories that start with this prefix
                 for page in paginator.paginate(
                     Bucket=config.bucket_name, Prefix=prefix, Delimiter="/"
                 ):
+                    if stopped():
+                        break
                     if "CommonPrefixes" not in page:
                         continue
 
                     # For each protocol directory, list its version subdirectories
                     for prefix_obj in page["CommonPrefixes"]:
+                        if stopped():
+                            break
                         protocol_dir = prefix_obj.get("Prefix", "")
                         if not protocol_dir:
                             continue
 
                         total_directories += 1
                         
+                        # Skip past version directories that were already indexed
+                        last_indexed = max(
+                            (snapshot_id for snapshot_id, index_file_path in existing_snapshots.items()
+                             if index_file_path.startswith(protocol_dir)),
+                            key=_version_sort_key,
+                            default=None
+                        )
+                        list_kwargs = {}
+                        if last_indexed:
+                            list_kwargs["StartAfter"] = _start_after_version(protocol_dir, last_indexed)
+                        
                         # List all version subdirectories
                         try:
                             for version_page in paginator.paginate(
                                 Bucket=config.bucket_name,
                                 Prefix=protocol_dir,
-                                Delimiter="/"
+                                Delimiter="/",
+                                PaginationConfig={"PageSize": 1000},
+                                **list_kwargs
                             ):
+                                if stopped():
+                                    break
                                 if "CommonPrefixes" not in version_page:
                                     continue
 
                                 # Check each version directory for manifest
                                 for version_prefix in version_page["CommonPrefixes"]:
+                                    if stopped():
+                                        break
                                     version_dir = version_prefix.get("Prefix", "")
                                     if not version_dir:
                                         continue
 
                                     manifest_path = f"{version_dir}manifest-body.json"
                                     total_manifests_checked += 1
+                                    
+                                    # Extract snapshot information
+                                    snapshot_path = version_dir.rstrip('/')
+                                    snapshot_name = snapshot_path.split('/')[-1]
+                                    
+                                    # Check if this snapshot already exists in the database
+                                    if snapshot_name in existing_snapshots:
+                                        logger.debug(f"Snapshot {snapshot_name} already exists, skipping")
+                                        continue
 
                                     try:
-                                        # Try to get the manifest file
-                                        response = client.get_object(
-                                            Bucket=config.bucket_name, Key=manifest_path
-                                        )
+                                        if self.store_full_metadata:
+                                            # Try to get the manifest file
+                                            response = client.get_object(
+                                                Bucket=config.bucket_name, Key=manifest_path
+                                            )
+                                            
+                                            # Parse manifest data
+                                            manifest_data = response["Body"].read()
+                                            manifest_json = orjson.loads(manifest_data)
+                                            manifest_etag = response.get("ETag")
+                                            # Same file size total as the summary-only path
+                                            file_count, manifest_total_size = _summarize_manifest_files(manifest_json)
+                                            # Keep only summary fields, the full manifest is re-fetched from S3 on demand
+                                            enhanced_metadata = {
+                                                k: manifest_json[k] for k in MANIFEST_SUMMARY_FIELDS if k in manifest_json
+                                            }
+                                        else:
+                                            # Only the summary is needed, skip transferring the full body where
+                                            # S3 Select allows it, the full manifest is read otherwise
+                                            file_count, manifest_total_size, manifest_etag = self._read_manifest_summary(
+                                                client, config.bucket_name, manifest_path
+                                            )
+                                            enhanced_metadata = {}
                                         
-                                        # Parse manifest data
-                                        manifest_data = response["Body"].read()
-                                        import json
-                                        manifest_json = json.loads(manifest_data)
+                                        # The manifest summary is always kept, a header only refines the size below
+                                        enhanced_metadata.update({
+                                            "manifest_path": manifest_path,
+                                            "file_count": file_count,
+                                            "total_size_bytes": manifest_total_size,
+                                            "total_size_formatted": format_bytes(manifest_total_size)
+                                        })
                                         
                                         # Also try to get the manifest-header.json file for additional metadata
                                         header_manifest_path = f"{version_dir}manifest-header.json"
@@ -334,35 +486,20 @@ class BackgroundScannerService:
                                             header_response = client.get_object(
                                                 Bucket=config.bucket_name, Key=header_manifest_path
                                             )
-                                            header_data = json.loads(
-                                                header_response["Body"].read().decode("utf-8")
+                                            header_data = orjson.loads(
+                                                header_response["Body"].read()
                                             )
                                             logger.info(f"Found header manifest: {header_manifest_path}")
                                         except client.exceptions.NoSuchKey:
                                             logger.debug(f"No header manifest found at {header_manifest_path}")
-                                        except json.JSONDecodeError as e:
+                                        except orjson.JSONDecodeError as e:
                                             logger.error(f"Invalid JSON in header manifest at {header_manifest_path}: {str(e)}")
                                         
-                                        # Extract snapshot information
-                                        snapshot_path = version_dir.rstrip('/')
-                                        snapshot_name = snapshot_path.split('/')[-1]
-                                        
-                                        # Check if this snapshot already exists in the database
-                                        existing_snapshot = db.query(models.SnapshotIndex).filter(
-                                            models.SnapshotIndex.protocol_id == protocol.id,
-                                            models.SnapshotIndex.snapshot_id == snapshot_name
-                                        ).first()
-                                        
-                                        if existing_snapshot:
-                                            logger.debug(f"Snapshot {snapshot_name} already exists, skipping")
-                                            continue
-                                        
-                                        # Enhance manifest_json with header data if available
-                                        enhanced_metadata = manifest_json.copy()
-                                        actual_total_size = len(manifest_data)  # Default to manifest size
+                                        # Enhance metadata with header data if available
+                                        actual_total_size = manifest_total_size
                                         
                                         if header_data:
-                                            total_size_bytes = header_data.get("total_size", 0)
+                                            total_size_bytes = header_data.get("total_size") or manifest_total_size
                                             chunks_count = header_data.get("chunks", 0)
                                             
                                             enhanced_metadata.update({
@@ -379,15 +516,16 @@ class BackgroundScannerService:
                                             protocol_id=protocol.id,
                                             snapshot_id=snapshot_name,
                                             index_file_path=manifest_path,
-                                            file_count=len(manifest_json.get('files', [])) if 'files' in manifest_json else 0,
+                                            file_count=file_count,
                                             total_size=actual_total_size,
                                             created_at=datetime.utcnow(),
-                                            snapshot_metadata=enhanced_metadata
+                                            snapshot_metadata=enhanced_metadata,
+                                            etag=manifest_etag
                                         )
                                         
-                                        new_snapshot = crud.create_snapshot_index(db, snapshot_data)
-                                        new_snapshots.append(new_snapshot)
-                                        logger.info(f"Created new snapshot index: {snapshot_name} for protocol {protocol.name}")
+                                        new_snapshots.append(models.SnapshotIndex(**snapshot_data.model_dump()))
+                                        existing_snapshots[snapshot_name] = manifest_path
+                                        logger.info(f"Found new snapshot: {snapshot_name} for protocol {protocol.name}")
                                         
                                     except client.exceptions.NoSuchKey:
                                         # Manifest doesn't exist, skip this directory
@@ -401,7 +539,8 @@ class BackgroundScannerService:
                             logger.error(f"Error scanning version directories in {protocol_dir}: {e}")
                             continue
 
-            db.commit()
+            # Write all new snapshot indexes off the event loop
+            await asyncio.to_thread(_persist, db, protocol.id, new_snapshots)
             
             return {
                 "status": "success",
@@ -417,6 +556,49 @@ class BackgroundScannerService:
                 "message": str(e)
             }
 
+    def _read_manifest_summary(self, client, bucket_name: str, manifest_path: str) -> Tuple[int, int, Optional[str]]:
+        """Return (file_count, total_size, etag) for a manifest, using S3 Select when the backend supports it
+
+        S3 Select responses carry no ETag, so etag is only known when the body was fetched.
+        """
+        if self._select_supported:
+            try:
+                response = client.select_object_content(
+                    Bucket=bucket_name,
+                    Key=manifest_path,
+                    ExpressionType="SQL",
+                    Expression=MANIFEST_SUMMARY_EXPRESSION,
+                    InputSerialization={"JSON": {"Type": "DOCUMENT"}},
+                    OutputSerialization={"JSON": {}}
+                )
+                
+                # Records may be split across events, so collect the payload before splitting lines
+                payload = b"".join(
+                    event["Records"]["Payload"]
+                    for event in response["Payload"]
+                    if "Records" in event
+                )
+                file_count, total_size = _summarize_destinations(
+                    orjson.loads(line) for line in payload.splitlines() if line
+                )
+                return file_count, total_size, None
+                
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                if error_code == "NoSuchKey":
+                    raise
+                if error_code in SELECT_UNSUPPORTED_ERROR_CODES:
+                    # Many S3-compatible backends (e.g. B2) don't implement S3 Select
+                    logger.warning(f"S3 Select unavailable ({error_code}), falling back to full manifest reads")
+                    self._select_supported = False
+                else:
+                    # Throttling, a transient fault or a manifest Select can't parse, read just this one in full
+                    logger.debug(f"S3 Select failed for {manifest_path} ({error_code}), reading the full manifest")
+        
+        response = client.get_object(Bucket=bucket_name, Key=manifest_path)
+        file_count, total_size = _summarize_manifest_files(orjson.loads(response["Body"].read()))
+        return file_count, total_size, response.get("ETag")
+
 
 # Global instance
 background_scanner = BackgroundScannerService()
\ No newline at end of file
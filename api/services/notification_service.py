@@ -2,117 +2,322 @@
 Notification service for sending webhook notifications
 """
 
+import asyncio
+import functools
 import logging
-import json
-from typing import Dict, Any, List, Optional
-import aiohttp
-from datetime import datetime
+import re
+import time
+from typing import Awaitable, Dict, Any, List, Optional, Tuple
+import httpx
+import orjson
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# Platform limits used when batching several updates into one message
+DISCORD_MAX_EMBEDS = 10
+DISCORD_MAX_EMBED_CHARS = 6000  # Combined embed text of one message
+DISCORD_MAX_CONTENT_LENGTH = 2000
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+TELEGRAM_BATCH_SEPARATOR = "\n\n---\n\n"
+
+# Notes longer than this are formatted off the event loop
+LARGE_NOTES_THRESHOLD = 4096
+
+# Background delivery queue, bounded so a stuck webhook target cannot grow memory without limit
+NOTIFICATION_QUEUE_SIZE = 10_000
+NOTIFICATION_WORKERS = 8
+
+# Per-destination send rates (requests per second): per webhook for Discord/Slack, per bot for Telegram
+DISCORD_RATE_LIMIT = 5
+SLACK_RATE_LIMIT = 1
+TELEGRAM_RATE_LIMIT = 30
+
+# Requests in flight to any one host, so a burst of fan-out cannot overwhelm a single webhook target
+MAX_REQUESTS_PER_HOST = 20
+
+# Longest Retry-After honored on a 429 before giving up on the send
+MAX_RETRY_AFTER = 60
+
+
+class _TokenBucket:
+    """Token bucket allowing `rate` requests per second, with bursts of up to `rate`"""
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    def pause(self, seconds: float):
+        """Hold all requests for this destination, e.g. after a 429 or an exhausted rate limit"""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """Seconds to wait before retrying a 429 response"""
+    try:
+        return float(response.headers.get("Retry-After", 1))
+    except ValueError:
+        return 1.0
+
+
+def _has_content(s: Optional[str]) -> bool:
+    """True if s has any non-whitespace character, without allocating a stripped copy"""
+    return bool(s) and not s.isspace()
+
+
+# Telegram Markdown characters that must be escaped in free-form text
+_TG_ESCAPE = re.compile(r'([*_\[\]`])')
+
+# Fixed segments of the Telegram update message
+_TG_CLIENT_HDR = "📦 *Client:* "
+_TG_VERSION_HDR = "\n🏷️ *Version:* `"
+_TG_TYPE_HDR = "`\n📝 *Type:* "
+_TG_NOTES_HDR = "\n📋 *Release Notes:*\n"
+_TG_VIEW_RELEASE = "\n🔗 [View Release]("
+
+# Discord avatar / footer icon and the shared footer label
+PROTOCOL_TRACKER_ICON_URL = "https://cdn-icons-png.flaticon.com/512/8297/8297741.png"
+PROTOCOL_TRACKER_FOOTER = "Protocol Tracker"
+
 class NotificationService:
     """Service for sending notifications via webhooks"""
     
+    # Static payload fields encoded once, without the closing brace so per-message fields can be appended
+    _DISCORD_BASE_BYTES = orjson.dumps({
+        "username": "Protocol Tracker",
+        "avatar_url": PROTOCOL_TRACKER_ICON_URL
+    })[:-1]
+    _SLACK_BASE_BYTES = orjson.dumps({
+        "username": "Protocol Tracker",
+        "icon_emoji": ":bell:"
+    })[:-1]
+    
+    __slots__ = ("_client", "_queue", "_workers", "_buckets", "_host_limits")
+    
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+    
+    def start_workers(self):
+        """Start the background delivery workers, called once at app startup"""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(NOTIFICATION_WORKERS)]
+        logger.info(f"Started {NOTIFICATION_WORKERS} notification workers")
+    
+    async def stop_workers(self):
+        """Drain the queue and stop the background delivery workers"""
+        if not self._workers:
+            return
+        # One sentinel per worker, queued behind any pending jobs so they are still delivered
+        for _ in self._workers:
+            await self._queue.put(None)
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        logger.info("Notification workers stopped")
+    
+    async def enqueue_batch_protocol_updates(self, updates: List[Dict[str, Any]], **targets) -> None:
+        """Queue protocol updates for background delivery, see send_batch_protocol_updates for arguments
+        
+        Falls back to sending inline when the workers are not running.
+        """
+        if not self._workers:
+            results = await self.send_batch_protocol_updates(updates, **targets)
+            self._log_failures(updates, results)
+            return
+        await self._queue.put((updates, targets))
+    
+    async def _worker(self):
+        """Deliver queued notification jobs until a sentinel is received"""
+        while True:
+            job = await self._queue.get()
+            try:
+                if job is None:
+                    return
+                updates, targets = job
+                results = await self.send_batch_protocol_updates(updates, **targets)
+                self._log_failures(updates, results)
+            except Exception as e:
+                logger.error(f"Error delivering queued notification: {e}")
+            finally:
+                self._queue.task_done()
+    
     @staticmethod
-    async def send_discord_webhook(webhook_url: str, message: str, embeds: List[Dict[str, Any]] = None) -> bool:
-        """Send a Discord webhook notification"""
-        try:
-            payload = {
-                "content": message,
-                "username": "Protocol Tracker",
-                "avatar_url": "https://cdn-icons-png.flaticon.com/512/8297/8297741.png"
-            }
+    def _log_failures(updates: List[Dict[str, Any]], results: Dict[str, Any]):
+        """Log the channels that failed for a delivered batch"""
+        failed = [channel for channel, outcomes in results.items() if any(not o['success'] for o in outcomes)]
+        if failed:
+            tags = ", ".join(update['tag'] for update in updates)
+            logger.warning(f"Failed to send notifications for {updates[0]['client_name']} {tags}: {', '.join(failed)}")
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            # Long-lived pool, HTTP/2 lets fan-out to the same host multiplex over one connection
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+                timeout=10.0
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client and its connection pool"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+    
+    async def _post_raw(self, url: str, body: bytes, headers: Dict[str, str] = None, rate_key: str = None, rate: float = None) -> httpx.Response:
+        """POST an already JSON-encoded body, rate limited per rate_key when given
+        
+        A 429 is retried once after its Retry-After delay.
+        """
+        bucket = None
+        if rate_key is not None:
+            bucket = self._buckets.get(rate_key)
+            if bucket is None:
+                bucket = self._buckets[rate_key] = _TokenBucket(rate)
+        
+        # httpx.Limits only bounds the whole pool, cap each destination host here
+        host = httpx.URL(url).host
+        host_limit = self._host_limits.get(host)
+        if host_limit is None:
+            host_limit = self._host_limits[host] = asyncio.Semaphore(MAX_REQUESTS_PER_HOST)
+        
+        client = self._get_client()
+        for attempt in range(2):
+            if bucket:
+                await bucket.acquire()
+            # The (small) body is read with the response so the connection goes straight back to the
+            # pool, an unread HTTP/1.1 body would force httpx to close it. Senders only decode it as
+            # text on their error paths
+            async with host_limit:
+                response = await client.post(url, content=body, headers=headers or JSON_HEADERS)
             
-            if embeds:
-                payload["embeds"] = embeds
+            if response.status_code != 429:
+                # Discord reports when the bucket is exhausted ahead of the next request
+                if bucket and response.headers.get("X-RateLimit-Remaining") == "0":
+                    try:
+                        bucket.pause(float(response.headers.get("X-RateLimit-Reset-After", 0)))
+                    except ValueError:
+                        pass
+                return response
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(webhook_url, json=payload) as response:
-                    if response.status == 204:
-                        logger.info("Discord webhook sent successfully")
-                        return True
-                    else:
-                        logger.error(f"Discord webhook failed with status {response.status}: {await response.text()}")
-                        return False
-                        
-        except Exception as e:
-            logger.error(f"Error sending Discord webhook: {e}")
-            return False
+            delay = _retry_after(response)
+            if attempt or delay > MAX_RETRY_AFTER:
+                return response
+            logger.warning(f"Rate limited by {host}, retrying in {delay}s")
+            if bucket:
+                bucket.pause(delay)
+            else:
+                await asyncio.sleep(delay)
+        return response
     
     @staticmethod
-    async def send_slack_webhook(webhook_url: str, message: str, attachments: List[Dict[str, Any]] = None) -> bool:
-        """Send a Slack webhook notification"""
-        try:
-            payload = {
-                "text": message,
-                "username": "Protocol Tracker",
-                "icon_emoji": ":bell:"
-            }
-            
-            if attachments:
-                payload["attachments"] = attachments
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(webhook_url, json=payload) as response:
-                    if response.status == 200:
-                        logger.info("Slack webhook sent successfully")
-                        return True
-                    else:
-                        logger.error(f"Slack webhook failed with status {response.status}: {await response.text()}")
-                        return False
-                        
-        except Exception as e:
-            logger.error(f"Error sending Slack webhook: {e}")
-            return False
+    def _build_discord_body(message: str, embeds: List[Dict[str, Any]] = None) -> bytes:
+        """Encode a Discord webhook payload"""
+        body = NotificationService._DISCORD_BASE_BYTES + b',"content":' + orjson.dumps(message)
+        if embeds:
+            body += b',"embeds":' + orjson.dumps(embeds)
+        return body + b'}'
     
     @staticmethod
-    async def send_telegram_message(bot_token: str, chat_id: str, message: str, parse_mode: str = "Markdown") -> bool:
+    def _build_slack_body(message: str, attachments: List[Dict[str, Any]] = None) -> bytes:
+        """Encode a Slack webhook payload"""
+        body = NotificationService._SLACK_BASE_BYTES + b',"text":' + orjson.dumps(message)
+        if attachments:
+            body += b',"attachments":' + orjson.dumps(attachments)
+        return body + b'}'
+    
+    async def send_discord_webhook(self, webhook_url: str, message: str = None, embeds: List[Dict[str, Any]] = None, body: bytes = None) -> bool:
+        """Send a Discord webhook notification, body can be passed pre-encoded when fanning out"""
+        if body is None:
+            body = self._build_discord_body(message, embeds)
+        
+        response = await self._post_raw(webhook_url, body, rate_key=webhook_url, rate=DISCORD_RATE_LIMIT)
+        if response.status_code == 204:
+            logger.info("Discord webhook sent successfully")
+            return True
+        else:
+            logger.error(f"Discord webhook failed with status {response.status_code}: {response.text}")
+            return False
+    
+    async def send_slack_webhook(self, webhook_url: str, message: str = None, attachments: List[Dict[str, Any]] = None, body: bytes = None) -> bool:
+        """Send a Slack webhook notification, body can be passed pre-encoded when fanning out"""
+        if body is None:
+            body = self._build_slack_body(message, attachments)
+        
+        response = await self._post_raw(webhook_url, body, rate_key=webhook_url, rate=SLACK_RATE_LIMIT)
+        if response.status_code == 200:
+            logger.info("Slack webhook sent successfully")
+            return True
+        else:
+            logger.error(f"Slack webhook failed with status {response.status_code}: {response.text}")
+            return False
+    
+    async def send_telegram_message(self, bot_token: str, chat_id: str, message: str, parse_mode: str = "Markdown") -> bool:
         """Send a Telegram message"""
-        try:
-            url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-            payload = {
-                "chat_id": chat_id,
-                "text": message,
-                "parse_mode": parse_mode,
-                "disable_web_page_preview": False
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload) as response:
-                    if response.status == 200:
-                        logger.info("Telegram message sent successfully")
-                        return True
-                    else:
-                        logger.error(f"Telegram message failed with status {response.status}: {await response.text()}")
-                        return False
-                        
-        except Exception as e:
-            logger.error(f"Error sending Telegram message: {e}")
+        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+        body = orjson.dumps({
+            "chat_id": chat_id,
+            "text": message,
+            "parse_mode": parse_mode,
+            "disable_web_page_preview": False
+        })
+        
+        response = await self._post_raw(url, body, rate_key=f"telegram:{bot_token}", rate=TELEGRAM_RATE_LIMIT)
+        if response.status_code == 200:
+            logger.info("Telegram message sent successfully")
+            return True
+        else:
+            logger.error(f"Telegram message failed with status {response.status_code}: {response.text}")
             return False
     
-    @staticmethod
-    async def send_generic_webhook(webhook_url: str, payload: Dict[str, Any], headers: Dict[str, str] = None) -> bool:
-        """Send a generic JSON webhook"""
-        try:
-            request_headers = {"Content-Type": "application/json"}
-            if headers:
-                request_headers.update(headers)
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(webhook_url, json=payload, headers=request_headers) as response:
-                    if 200 <= response.status < 300:
-                        logger.info(f"Generic webhook sent successfully (status: {response.status})")
-                        return True
-                    else:
-                        logger.error(f"Generic webhook failed with status {response.status}: {await response.text()}")
-                        return False
-                        
-        except Exception as e:
-            logger.error(f"Error sending generic webhook: {e}")
+    async def send_generic_webhook(self, webhook_url: str, payload: Dict[str, Any] = None, headers: Dict[str, str] = None, body: bytes = None) -> bool:
+        """Send a generic JSON webhook, body can be passed pre-encoded when fanning out"""
+        request_headers = dict(JSON_HEADERS)
+        if headers:
+            request_headers.update(headers)
+        
+        if body is None:
+            body = orjson.dumps(payload)
+        
+        response = await self._post_raw(webhook_url, body, request_headers)
+        if 200 <= response.status_code < 300:
+            logger.info(f"Generic webhook sent successfully (status: {response.status_code})")
+            return True
+        else:
+            logger.error(f"Generic webhook failed with status {response.status_code}: {response.text}")
             return False
     
     @staticmethod
-    def format_protocol_update_discord_embed(client_name: str, tag: str, title: str, url: str, notes: str = None, is_prerelease: bool = False) -> Dict[str, Any]:
+    def format_protocol_update_discord_embed(client_name: str, tag: str, title: str, url: str, notes: str = None, is_prerelease: bool = False, now_iso: str = None) -> Dict[str, Any]:
         """Format a protocol update as a Discord embed"""
         color = 0xffa500 if is_prerelease else 0x00ff00  # Orange for prerelease, green for release
         
@@ -121,10 +326,10 @@ class NotificationService:
             "description": title or f"New release {tag} is now available",
             "color": color,
             "url": url,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso or datetime.now(timezone.utc).isoformat(),
             "footer": {
-                "text": "Protocol Tracker",
-                "icon_url": "https://cdn-icons-png.flaticon.com/512/8297/8297741.png"
+                "text": PROTOCOL_TRACKER_FOOTER,
+                "icon_url": PROTOCOL_TRACKER_ICON_URL
             },
             "fields": [
                 {
@@ -145,7 +350,7 @@ class NotificationService:
             ]
         }
         
-        if notes and len(notes.strip()) > 0:
+        if _has_content(notes):
             # Truncate notes if too long (Discord has limits)
             truncated_notes = notes[:500] + "..." if len(notes) > 500 else notes
             embed["fields"].append({
@@ -157,7 +362,7 @@ class NotificationService:
         return embed
     
     @staticmethod
-    def format_protocol_update_slack_attachment(client_name: str, tag: str, title: str, url: str, notes: str = None, is_prerelease: bool = False) -> Dict[str, Any]:
+    def format_protocol_update_slack_attachment(client_name: str, tag: str, title: str, url: str, notes: str = None, is_prerelease: bool = False, now_ts: int = None) -> Dict[str, Any]:
         """Format a protocol update as a Slack attachment"""
         color = "warning" if is_prerelease else "good"  # Yellow for prerelease, green for release
         
@@ -184,11 +389,11 @@ class NotificationService:
                     "short": True
                 }
             ],
-            "footer": "Protocol Tracker",
-            "ts": int(datetime.utcnow().timestamp())
+            "footer": PROTOCOL_TRACKER_FOOTER,
+            "ts": now_ts if now_ts is not None else int(datetime.now(timezone.utc).timestamp())
         }
         
-        if notes and len(notes.strip()) > 0:
+        if _has_content(notes):
             # Truncate notes if too long
             truncated_notes = notes[:300] + "..." if len(notes) > 300 else notes
             attachment["fields"].append({
@@ -204,32 +409,33 @@ class NotificationService:
         """Format a protocol update as a Telegram message"""
         release_type = "🔥 Pre-release" if is_prerelease else "🚀 Release"
         
-        message = f"*{release_type}*: [{client_name} {tag}]({url})\n\n"
+        parts = ["*", release_type, "*: [", client_name, " ", tag, "](", url, ")\n\n"]
         
         if title:
-            message += f"*{title}*\n\n"
+            parts += ["*", title, "*\n\n"]
         
-        message += f"📦 *Client:* {client_name}\n"
-        message += f"🏷️ *Version:* `{tag}`\n"
-        message += f"📝 *Type:* {'Pre-release' if is_prerelease else 'Release'}\n"
+        parts += [
+            _TG_CLIENT_HDR, client_name,
+            _TG_VERSION_HDR, tag,
+            _TG_TYPE_HDR, "Pre-release" if is_prerelease else "Release", "\n"
+        ]
         
-        if notes and len(notes.strip()) > 0:
+        if _has_content(notes):
             # Truncate notes if too long (Telegram has 4096 char limit)
             truncated_notes = notes[:800] + "..." if len(notes) > 800 else notes
             # Escape markdown special characters in notes
-            escaped_notes = truncated_notes.replace('*', '\\*').replace('_', '\\_').replace('[', '\\[').replace(']', '\\]').replace('`', '\\`')
-            message += f"\n📋 *Release Notes:*\n{escaped_notes}\n"
+            parts += [_TG_NOTES_HDR, _TG_ESCAPE.sub(r'\\\1', truncated_notes), "\n"]
         
-        message += f"\n🔗 [View Release]({url})"
+        parts += [_TG_VIEW_RELEASE, url, ")"]
         
-        return message
+        return "".join(parts)
     
     @staticmethod
-    def format_protocol_update_generic(client_name: str, tag: str, title: str, url: str, notes: str = None, is_prerelease: bool = False) -> Dict[str, Any]:
+    def format_protocol_update_generic(client_name: str, tag: str, title: str, url: str, notes: str = None, is_prerelease: bool = False, now_iso: str = None) -> Dict[str, Any]:
         """Format a protocol update as a generic JSON payload"""
         return {
             "event": "protocol_update",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso or datetime.now(timezone.utc).isoformat(),
             "data": {
                 "client": client_name,
                 "tag": tag,
@@ -241,6 +447,39 @@ class NotificationService:
             }
         }
     
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _build_formatted_payloads(client_name: str, tag: str, title: str, url: str, notes: str = None, is_prerelease: bool = False) -> Tuple[bytes, bytes, str, bytes]:
+        """Build (discord_body, slack_body, telegram_text, generic_body) for a protocol update
+
+        Memoized on the update fields, so the timestamps embedded in the payloads are those
+        of the first time the update was formatted.
+        """
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
+        now_ts = int(now.timestamp())
+        
+        discord_body = NotificationService._build_discord_body(
+            f"🚀 New {client_name} release: **{tag}**",
+            [NotificationService.format_protocol_update_discord_embed(
+                client_name, tag, title, url, notes, is_prerelease, now_iso=now_iso
+            )]
+        )
+        slack_body = NotificationService._build_slack_body(
+            f"🚀 New {client_name} release: {tag}",
+            [NotificationService.format_protocol_update_slack_attachment(
+                client_name, tag, title, url, notes, is_prerelease, now_ts=now_ts
+            )]
+        )
+        telegram_text = NotificationService.format_protocol_update_telegram(
+            client_name, tag, title, url, notes, is_prerelease
+        )
+        generic_body = orjson.dumps(NotificationService.format_protocol_update_generic(
+            client_name, tag, title, url, notes, is_prerelease, now_iso=now_iso
+        ))
+        
+        return discord_body, slack_body, telegram_text, generic_body
+    
     async def send_protocol_update_notifications(
         self, 
         client_name: str, 
@@ -261,18 +500,18 @@ class NotificationService:
         generic_webhook_url: str = None,
         generic_headers: Dict[str, str] = None
     ) -> Dict[str, Any]:
-        """Send protocol update notifications to all configured webhooks"""
-        results = {
-            'discord': [],
-            'slack': [],
-            'telegram': [],
-            'generic': []
-        }
+        """Send protocol update notifications to all configured webhooks concurrently"""
+        # Format and encode every channel's payload once, re-sends of the same update hit the cache
+        args = (client_name, tag, title, url, notes, is_prerelease)
+        if notes and len(notes) > LARGE_NOTES_THRESHOLD:
+            # Escaping and encoding a huge changelog would stall concurrent deliveries
+            payloads = await asyncio.to_thread(self._build_formatted_payloads, *args)
+        else:
+            payloads = self._build_formatted_payloads(*args)
+        discord_body, slack_body, telegram_message, generic_body = payloads
         
-        # Prepare Discord embed once
-        discord_embed = self.format_protocol_update_discord_embed(
-            client_name, tag, title, url, notes, is_prerelease
-        )
+        # Each send is tagged with (channel, result key, target) so outcomes can be mapped back
+        tagged_sends = []
         
         # Send Discord notifications (multiple URLs)
         all_discord_urls = []
@@ -282,17 +521,10 @@ class NotificationService:
             all_discord_urls.append(discord_webhook_url)
         
         for webhook_url in all_discord_urls:
-            success = await self.send_discord_webhook(
+            tagged_sends.append((('discord', 'url', webhook_url), self.send_discord_webhook(
                 webhook_url,
-                f"🚀 New {client_name} release: **{tag}**",
-                [discord_embed]
-            )
-            results['discord'].append({'url': webhook_url, 'success': success})
-        
-        # Prepare Slack attachment once
-        slack_attachment = self.format_protocol_update_slack_attachment(
-            client_name, tag, title, url, notes, is_prerelease
-        )
+                body=discord_body
+            )))
         
         # Send Slack notifications (multiple URLs)
         all_slack_urls = []
@@ -302,31 +534,19 @@ class NotificationService:
             all_slack_urls.append(slack_webhook_url)
         
         for webhook_url in all_slack_urls:
-            success = await self.send_slack_webhook(
+            tagged_sends.append((('slack', 'url', webhook_url), self.send_slack_webhook(
                 webhook_url,
-                f"🚀 New {client_name} release: {tag}",
-                [slack_attachment]
-            )
-            results['slack'].append({'url': webhook_url, 'success': success})
+                body=slack_body
+            )))
         
         # Send Telegram notifications (multiple chat IDs)
         if telegram_bot_token and telegram_chat_ids:
-            telegram_message = self.format_protocol_update_telegram(
-                client_name, tag, title, url, notes, is_prerelease
-            )
-            
             for chat_id in telegram_chat_ids:
-                success = await self.send_telegram_message(
+                tagged_sends.append((('telegram', 'chat_id', chat_id), self.send_telegram_message(
                     telegram_bot_token,
                     chat_id,
                     telegram_message
-                )
-                results['telegram'].append({'chat_id': chat_id, 'success': success})
-        
-        # Prepare generic payload once
-        generic_payload = self.format_protocol_update_generic(
-            client_name, tag, title, url, notes, is_prerelease
-        )
+                )))
         
         # Send generic webhook notifications (multiple URLs with custom headers)
         all_generic_configs = []
@@ -339,15 +559,193 @@ class NotificationService:
             })
         
         for config in all_generic_configs:
-            success = await self.send_generic_webhook(
+            tagged_sends.append((('generic', 'url', config['url']), self.send_generic_webhook(
                 config['url'],
-                generic_payload,
-                config.get('headers')
-            )
-            results['generic'].append({'url': config['url'], 'success': success})
+                headers=config.get('headers'),
+                body=generic_body
+            )))
+        
+        return await self._dispatch(tagged_sends)
+    
+    async def _dispatch(self, tagged_sends: List[Tuple[Tuple[str, str, str], Awaitable[bool]]]) -> Dict[str, Any]:
+        """Run tagged sends concurrently and collect their outcomes per channel"""
+        results = {
+            'discord': [],
+            'slack': [],
+            'telegram': [],
+            'generic': []
+        }
+        
+        # Dispatch everything at once, total latency is the slowest send rather than the sum
+        outcomes = await asyncio.gather(*[send for _, send in tagged_sends], return_exceptions=True)
+        
+        for (channel, key, target), outcome in zip([label for label, _ in tagged_sends], outcomes):
+            if isinstance(outcome, BaseException):
+                # Senders let transport errors propagate, they are classified here in one place
+                logger.error(f"Error sending {channel} notification: {outcome}")
+                results[channel].append({key: target, 'success': False, 'error': str(outcome)})
+            else:
+                results[channel].append({key: target, 'success': outcome})
         
         return results
     
+    @staticmethod
+    def _discord_embed_length(embed: Dict[str, Any]) -> int:
+        """Characters of an embed that count towards Discord's per-message embed text limit"""
+        return (
+            len(embed.get('title') or '')
+            + len(embed.get('description') or '')
+            + len((embed.get('footer') or {}).get('text') or '')
+            + len((embed.get('author') or {}).get('name') or '')
+            + sum(len(f.get('name') or '') + len(f.get('value') or '') for f in embed.get('fields') or ())
+        )
+    
+    @staticmethod
+    def _discord_batch_content(updates: List[Dict[str, Any]]) -> str:
+        """Message content for one Discord batch message, listing only the updates it carries"""
+        prefix = f"🚀 {len(updates)} new release{'s' if len(updates) != 1 else ''}: **"
+        summary = ", ".join(f"{u['client_name']} {u['tag']}" for u in updates)
+        # Keep within Discord's content limit, the embeds carry the full details
+        room = DISCORD_MAX_CONTENT_LENGTH - len(prefix) - len("**")
+        if len(summary) > room:
+            summary = summary[:room - 1] + "…"
+        return f"{prefix}{summary}**"
+    
+    @staticmethod
+    def _build_batch_payloads(
+        updates: List[Dict[str, Any]],
+        discord: bool,
+        slack: bool,
+        telegram: bool,
+        generic: bool
+    ) -> Tuple[List[bytes], Optional[bytes], List[str], List[bytes]]:
+        """Build the combined payloads for a batch, only for the channels that are configured"""
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
+        now_ts = int(now.timestamp())
+        
+        summary = ", ".join(f"{u['client_name']} {u['tag']}" for u in updates)
+        discord_bodies, slack_body, telegram_messages, generic_bodies = [], None, [], []
+        
+        if discord:
+            # Split where either the embed count or the combined embed text limit requires it
+            chunks, chunk_chars = [], 0
+            for u in updates:
+                embed = NotificationService.format_protocol_update_discord_embed(**u, now_iso=now_iso)
+                embed_chars = NotificationService._discord_embed_length(embed)
+                if chunks and len(chunks[-1]) < DISCORD_MAX_EMBEDS and chunk_chars + embed_chars <= DISCORD_MAX_EMBED_CHARS:
+                    chunks[-1].append((u, embed))
+                    chunk_chars += embed_chars
+                else:
+                    chunks.append([(u, embed)])
+                    chunk_chars = embed_chars
+            discord_bodies = [
+                NotificationService._build_discord_body(
+                    NotificationService._discord_batch_content([u for u, _ in chunk]),
+                    [embed for _, embed in chunk]
+                )
+                for chunk in chunks
+            ]
+        
+        if slack:
+            slack_body = NotificationService._build_slack_body(
+                f"🚀 {len(updates)} new releases: {summary}",
+                [NotificationService.format_protocol_update_slack_attachment(**u, now_ts=now_ts) for u in updates]
+            )
+        
+        if telegram:
+            # Join updates into as few messages as the length limit allows
+            for message in (NotificationService.format_protocol_update_telegram(**u) for u in updates):
+                if telegram_messages and len(telegram_messages[-1]) + len(TELEGRAM_BATCH_SEPARATOR) + len(message) <= TELEGRAM_MAX_MESSAGE_LENGTH:
+                    telegram_messages[-1] += TELEGRAM_BATCH_SEPARATOR + message
+                else:
+                    telegram_messages.append(message)
+        
+        if generic:
+            generic_bodies = [
+                orjson.dumps(NotificationService.format_protocol_update_generic(**u, now_iso=now_iso)) for u in updates
+            ]
+        
+        return discord_bodies, slack_body, telegram_messages, generic_bodies
+    
+    async def send_batch_protocol_updates(
+        self,
+        updates: List[Dict[str, Any]],
+        discord_webhook_urls: List[str] = None,
+        slack_webhook_urls: List[str] = None,
+        telegram_bot_token: str = None,
+        telegram_chat_ids: List[str] = None,
+        generic_webhook_configs: List[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Send several protocol updates as combined messages
+
+        Each update is a dict with the send_protocol_update_notifications arguments
+        (client_name, tag, title, url, notes, is_prerelease). Discord gets up to 10 embeds
+        and 6000 characters of embed text per message, Slack one message with every attachment and Telegram one message per
+        chat, split only where the 4096 character limit requires it. Generic webhooks keep
+        receiving one protocol_update event per update.
+        """
+        if len(updates) == 1:
+            return await self.send_protocol_update_notifications(
+                **updates[0],
+                discord_webhook_urls=discord_webhook_urls,
+                slack_webhook_urls=slack_webhook_urls,
+                telegram_bot_token=telegram_bot_token,
+                telegram_chat_ids=telegram_chat_ids,
+                generic_webhook_configs=generic_webhook_configs
+            )
+        
+        build = functools.partial(
+            self._build_batch_payloads,
+            updates,
+            discord=bool(discord_webhook_urls),
+            slack=bool(slack_webhook_urls),
+            telegram=bool(telegram_bot_token and telegram_chat_ids),
+            generic=bool(generic_webhook_configs)
+        )
+        if any(u.get('notes') and len(u['notes']) > LARGE_NOTES_THRESHOLD for u in updates):
+            # Escaping and encoding huge changelogs would stall concurrent deliveries
+            discord_bodies, slack_body, telegram_messages, generic_bodies = await asyncio.to_thread(build)
+        else:
+            discord_bodies, slack_body, telegram_messages, generic_bodies = build()
+        
+        tagged_sends = []
+        
+        if discord_webhook_urls:
+            for webhook_url in discord_webhook_urls:
+                for body in discord_bodies:
+                    tagged_sends.append((('discord', 'url', webhook_url), self.send_discord_webhook(
+                        webhook_url,
+                        body=body
+                    )))
+        
+        if slack_webhook_urls:
+            for webhook_url in slack_webhook_urls:
+                tagged_sends.append((('slack', 'url', webhook_url), self.send_slack_webhook(
+                    webhook_url,
+                    body=slack_body
+                )))
+        
+        if telegram_bot_token and telegram_chat_ids:
+            for chat_id in telegram_chat_ids:
+                for message in telegram_messages:
+                    tagged_sends.append((('telegram', 'chat_id', chat_id), self.send_telegram_message(
+                        telegram_bot_token,
+                        chat_id,
+                        message
+                    )))
+        
+        if generic_webhook_configs:
+            for config in generic_webhook_configs:
+                for body in generic_bodies:
+                    tagged_sends.append((('generic', 'url', config['url']), self.send_generic_webhook(
+                        config['url'],
+                        headers=config.get('headers'),
+                        body=body
+                    )))
+        
+        return await self._dispatch(tagged_sends)
+    
     async def test_webhook(self, webhook_type: str, webhook_url: str = None, bot_token: str = None, chat_id: str = None, headers: Dict[str, str] = None) -> bool:
         """Test a webhook configuration"""
         try:
@@ -359,7 +757,7 @@ class NotificationService:
                         "title": "Webhook Test",
                         "description": "This is a test notification to verify your Discord webhook is working correctly.",
                         "color": 0x0066cc,
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
                         "footer": {
                             "text": "Protocol Tracker Test"
                         }
@@ -393,7 +791,7 @@ class NotificationService:
                     {
                         "event": "webhook_test",
                         "message": "This is a test notification from Protocol Tracker",
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
                         "source": "Protocol Tracker"
                     },
                     headers
@@ -405,4 +803,8 @@ class NotificationService:
                 
         except Exception as e:
             logger.error(f"Error testing {webhook_type} webhook: {e}")
-            return False
\ No newline at end of file
+            return False
+
+
+# Global instance
+notification_service = NotificationService()
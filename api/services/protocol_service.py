@@ -3,8 +3,10 @@ Protocol service for server-side operations
 """
 
 import logging
+from typing import List
 from sqlalchemy.orm import Session
 import crud
+import models
 import schemas
 
 logger = logging.getLogger(__name__)
@@ -21,4 +23,18 @@ class ProtocolService:
             return True
         except Exception as e:
             logger.error(f"Failed to create protocol update {update_data.tag}: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    def create_protocol_updates_bulk(self, db: Session, updates: List[schemas.ProtocolUpdatesCreate]) -> List[models.ProtocolUpdates]:
+        """Create several protocol updates in one round trip, returning the created rows
+
+        Failures are rolled back and re-raised so the caller can report them.
+        """
+        try:
+            created = crud.create_protocol_updates_bulk(db, updates)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to create {len(updates)} protocol updates: {e}")
+            raise
+        logger.info(f"Created {len(created)} protocol updates: {', '.join(u.tag for u in updates)}")
+        return created
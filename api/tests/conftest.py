@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The api modules import each other as top-level modules (import models, crud, ...)
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if API_DIR not in sys.path:
+    sys.path.insert(0, API_DIR)
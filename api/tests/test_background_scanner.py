@@ -0,0 +1,89 @@
+import os
+
+import orjson
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("fastapi")
+ClientError = pytest.importorskip("botocore.exceptions").ClientError
+
+from services.background_scanner import BackgroundScannerService, _summarize_manifest_files
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Three distinct files, 000002.sst spans two chunks
+EXPECTED_FILE_COUNT = 3
+EXPECTED_TOTAL_SIZE = 2097152 + 16 + 1048576 + 524288
+
+
+@pytest.fixture
+def manifest_body():
+    with open(os.path.join(FIXTURES_DIR, "manifest-body.json"), "rb") as f:
+        return f.read()
+
+
+class _Body:
+    def __init__(self, data):
+        self._data = data
+
+    def read(self):
+        return self._data
+
+
+class FakeS3Client:
+    def __init__(self, manifest_body, select_error=None):
+        self.manifest_body = manifest_body
+        self.select_error = select_error
+        self.get_object_calls = 0
+
+    def select_object_content(self, **kwargs):
+        if self.select_error:
+            raise ClientError({"Error": {"Code": self.select_error}}, "SelectObjectContent")
+        # Emulate S3 Select evaluating the summary expression, one JSON record per destination
+        manifest = orjson.loads(self.manifest_body)
+        records = b"".join(
+            orjson.dumps({"path": d["path"], "size": d["size"]}) + b"\n"
+            for chunk in manifest["chunks"] for d in chunk["destinations"]
+        )
+        # Split mid-record, records are not aligned to events
+        return {"Payload": [{"Records": {"Payload": records[:40]}}, {"Records": {"Payload": records[40:]}}, {"End": {}}]}
+
+    def get_object(self, **kwargs):
+        self.get_object_calls += 1
+        return {"Body": _Body(self.manifest_body), "ETag": '"etag"'}
+
+
+def test_summarize_manifest_files(manifest_body):
+    assert _summarize_manifest_files(orjson.loads(manifest_body)) == (EXPECTED_FILE_COUNT, EXPECTED_TOTAL_SIZE)
+
+
+def test_read_manifest_summary_with_select(manifest_body):
+    scanner = BackgroundScannerService()
+    client = FakeS3Client(manifest_body)
+
+    assert scanner._read_manifest_summary(client, "bucket", "manifest-body.json") == (
+        EXPECTED_FILE_COUNT, EXPECTED_TOTAL_SIZE, None
+    )
+    assert client.get_object_calls == 0
+
+
+def test_read_manifest_summary_without_select_support(manifest_body):
+    scanner = BackgroundScannerService()
+    client = FakeS3Client(manifest_body, select_error="NotImplemented")
+
+    assert scanner._read_manifest_summary(client, "bucket", "manifest-body.json") == (
+        EXPECTED_FILE_COUNT, EXPECTED_TOTAL_SIZE, '"etag"'
+    )
+    assert scanner._select_supported is False
+
+
+def test_read_manifest_summary_transient_select_error(manifest_body):
+    scanner = BackgroundScannerService()
+    client = FakeS3Client(manifest_body, select_error="SlowDown")
+
+    assert scanner._read_manifest_summary(client, "bucket", "manifest-body.json") == (
+        EXPECTED_FILE_COUNT, EXPECTED_TOTAL_SIZE, '"etag"'
+    )
+    # A per-object failure falls back for that manifest only
+    assert scanner._select_supported is True
+    assert client.get_object_calls == 1
@@ -0,0 +1,60 @@
+import orjson
+import pytest
+
+pytest.importorskip("httpx")
+
+from services.notification_service import (
+    DISCORD_MAX_CONTENT_LENGTH,
+    DISCORD_MAX_EMBED_CHARS,
+    DISCORD_MAX_EMBEDS,
+    NotificationService,
+)
+
+
+def _updates(count, title="Release", notes=None):
+    return [
+        {"client_name": f"client-{i}", "tag": f"v1.2.{i}", "title": title, "url": f"https://example.com/{i}", "notes": notes}
+        for i in range(count)
+    ]
+
+
+def _discord_messages(updates):
+    discord_bodies, _, _, _ = NotificationService._build_batch_payloads(
+        updates, discord=True, slack=False, telegram=False, generic=False
+    )
+    return [orjson.loads(body) for body in discord_bodies]
+
+
+def test_discord_batch_splits_by_embed_count():
+    messages = _discord_messages(_updates(25))
+    assert [len(m["embeds"]) for m in messages] == [10, 10, 5]
+
+
+def test_discord_batch_splits_by_embed_text():
+    updates = _updates(60, title="T" * 300, notes="x" * 600)
+    messages = _discord_messages(updates)
+
+    assert len(messages) > 60 // DISCORD_MAX_EMBEDS
+    assert sum(len(m["embeds"]) for m in messages) == len(updates)
+    for message in messages:
+        assert len(message["embeds"]) <= DISCORD_MAX_EMBEDS
+        assert sum(NotificationService._discord_embed_length(e) for e in message["embeds"]) <= DISCORD_MAX_EMBED_CHARS
+
+
+def test_discord_batch_content_lists_only_its_own_updates():
+    messages = _discord_messages(_updates(60))
+
+    for message in messages:
+        assert len(message["content"]) <= DISCORD_MAX_CONTENT_LENGTH
+        tags = [e["fields"][1]["value"] for e in message["embeds"]]
+        assert message["content"].startswith(f"🚀 {len(tags)} new releases: **")
+        for tag in tags:
+            assert tag in message["content"]
+    assert "v1.2.59" not in messages[0]["content"]
+
+
+def test_discord_batch_content_is_truncated_to_the_limit():
+    content = NotificationService._discord_batch_content([{"client_name": "c" * 3000, "tag": "v1"}])
+
+    assert len(content) == DISCORD_MAX_CONTENT_LENGTH
+    assert content.endswith("…**")
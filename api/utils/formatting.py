@@ -2,6 +2,19 @@
 Utility functions for formatting data in human-readable formats.
 """
 
+import bisect
+import functools
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Byte count at which each unit starts
+_THRESHOLDS = tuple(1000 ** i for i in range(len(_UNITS)))
+
+# Sizes from which fewer decimals are shown, and the matching templates
+_DECIMAL_THRESHOLDS = (10, 100)
+_SIZE_TEMPLATES = ('{:.2f} {}', '{:.1f} {}', '{:.0f} {}')
+
+
 def format_bytes(bytes_value):
     """
     Convert bytes to human-readable format (MB, GB, TB, PB).
@@ -15,27 +28,22 @@ def format_bytes(bytes_value):
     if bytes_value < 1000:
         return f"{bytes_value} B"
     
-    units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-    size = float(bytes_value)
-    unit_index = 0
-    
-    while size >= 1000 and unit_index < len(units) - 1:
-        size /= 1000
-        unit_index += 1
+    unit_index = bisect.bisect_right(_THRESHOLDS, bytes_value) - 1
+    size = bytes_value / _THRESHOLDS[unit_index]
     
-    # Format with appropriate decimal places
-    if size >= 100:
-        return f"{size:.0f} {units[unit_index]}"
-    elif size >= 10:
-        return f"{size:.1f} {units[unit_index]}"
-    else:
-        return f"{size:.2f} {units[unit_index]}"
+    # Format with appropriate decimal places: 2 below 10, 1 below 100, none above
+    template = _SIZE_TEMPLATES[bisect.bisect_right(_DECIMAL_THRESHOLDS, size)]
+    return template.format(size, _UNITS[unit_index])
 
 
+@functools.lru_cache(maxsize=4096, typed=True)
 def format_number_with_commas(number):
     """
     Format a number with comma separators for readability.
     
+    Cached, since the same counts repeat across the rows of a response. typed=True keeps
+    1 and 1.0 apart, they format differently.
+    
     Args:
         number (int): Number to format
         
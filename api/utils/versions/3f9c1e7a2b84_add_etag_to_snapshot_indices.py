@@ -0,0 +1,26 @@
+"""Add manifest etag to snapshot indices
+
+Revision ID: 3f9c1e7a2b84
+Revises: 9af7276ce3b2
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c1e7a2b84'
+down_revision: Union[str, None] = '9af7276ce3b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('snapshot_indices', sa.Column('etag', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('snapshot_indices', 'etag')
@@ -0,0 +1,33 @@
+"""Add client_id index on protocol_clients
+
+Revision ID: 5e1f0b3c9d27
+Revises: 7c2d5e8f1a90
+Create Date: 2026-10-15 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1f0b3c9d27'
+down_revision: Union[str, None] = '7c2d5e8f1a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The (protocol_id, client_id) primary key already serves protocol_id lookups, only
+    # client_id needs its own index
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_protocol_clients_client_id "
+            "ON protocol_clients (client_id)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_protocol_clients_client_id")
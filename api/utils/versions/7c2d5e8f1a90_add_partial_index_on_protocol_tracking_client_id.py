@@ -0,0 +1,33 @@
+"""Add partial index on protocol_tracking client_id
+
+Revision ID: 7c2d5e8f1a90
+Revises: 3f9c1e7a2b84
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2d5e8f1a90'
+down_revision: Union[str, None] = '3f9c1e7a2b84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Older rows predate the client FK and keep client_id NULL, so leave them out of the index.
+    # CONCURRENTLY keeps protocol_tracking writable during the build but cannot run in a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_protocol_tracking_client_id "
+            "ON protocol_tracking (client_id) WHERE client_id IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_protocol_tracking_client_id")
@@ -0,0 +1,27 @@
+"""Add server default to protocol_clients is_primary
+
+Revision ID: 8d4a6f2e0c13
+Revises: 5e1f0b3c9d27
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4a6f2e0c13'
+down_revision: Union[str, None] = '5e1f0b3c9d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Catalog-only change, existing rows are not touched
+    op.alter_column('protocol_clients', 'is_primary', server_default=sa.text('false'))
+
+
+def downgrade() -> None:
+    op.alter_column('protocol_clients', 'is_primary', server_default=None)
@@ -0,0 +1,198 @@
+"""Optimize AI analysis schema
+
+Revision ID: c7e1f4a9b203
+Revises: 8d4a6f2e0c13
+Create Date: 2026-10-15 14:00:00.000000
+
+protocol_tracking is set to fillfactor 80 so later AI-field updates can stay HOT. The column
+type changes in the same ALTER TABLE rewrite the table, which repacks existing rows with the
+new fillfactor, so no separate VACUUM FULL or pg_repack run is needed.
+
+Provider names move into an ai_providers lookup table, protocol_tracking keeps a SMALLINT
+ai_provider_id in place of the repeated VARCHAR name.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e1f4a9b203'
+down_revision: Union[str, None] = '8d4a6f2e0c13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Fixed upgrade priority vocabulary, stored as a native enum rather than VARCHAR
+AI_UPGRADE_PRIORITY = postgresql.ENUM('low', 'medium', 'high', 'critical', name='ai_upgrade_priority_enum')
+
+# USING expressions cannot contain subqueries, so JSON arrays are unpacked through a session-local
+# function. Elements that are not strings keep their JSON text, non-array values become NULL
+JSON_TO_TEXT_ARRAY = """
+    CREATE OR REPLACE FUNCTION pg_temp.json_to_text_array(value json) RETURNS text[] LANGUAGE sql IMMUTABLE AS $$
+        SELECT CASE WHEN json_typeof(value) = 'array' THEN ARRAY(SELECT json_array_elements_text(value)) END
+    $$
+"""
+
+# protocol_tracking changes applied in one ALTER TABLE, as (upgrade clause, downgrade clause)
+PROTOCOL_TRACKING_ALTERATIONS = (
+    # AI fields are filled in by later updates, free space per page keeps those updates HOT
+    ('SET (fillfactor = 80)', 'RESET (fillfactor)'),
+    # Backfilled from ai_provider once the lookup table is seeded
+    ('ADD COLUMN ai_provider_id SMALLINT REFERENCES ai_providers (id)', 'DROP COLUMN ai_provider_id'),
+    # Values outside the vocabulary (free-form model output) become NULL
+    (
+        "ALTER COLUMN ai_upgrade_priority TYPE ai_upgrade_priority_enum USING "
+        "(CASE WHEN lower(trim(ai_upgrade_priority)) IN ('low', 'medium', 'high', 'critical') "
+        "THEN lower(trim(ai_upgrade_priority)) END)::ai_upgrade_priority_enum",
+        "ALTER COLUMN ai_upgrade_priority TYPE VARCHAR(20) USING ai_upgrade_priority::text"
+    ),
+    (
+        'ALTER COLUMN ai_security_updates TYPE JSONB USING ai_security_updates::jsonb',
+        'ALTER COLUMN ai_security_updates TYPE JSON USING ai_security_updates::json'
+    ),
+    # Key and breaking changes are flat string lists
+    (
+        'ALTER COLUMN ai_key_changes TYPE TEXT[] USING pg_temp.json_to_text_array(ai_key_changes)',
+        'ALTER COLUMN ai_key_changes TYPE JSON USING array_to_json(ai_key_changes)'
+    ),
+    (
+        'ALTER COLUMN ai_breaking_changes TYPE TEXT[] USING pg_temp.json_to_text_array(ai_breaking_changes)',
+        'ALTER COLUMN ai_breaking_changes TYPE JSON USING array_to_json(ai_breaking_changes)'
+    ),
+)
+
+# ai_analysis_feedback changes applied in one ALTER TABLE, as (upgrade clause, downgrade clause)
+FEEDBACK_ALTERATIONS = (
+    # Bounded to 1..5 by rating_check
+    ('ALTER COLUMN rating TYPE SMALLINT', 'ALTER COLUMN rating TYPE INTEGER'),
+    (
+        'ALTER COLUMN helpful_aspects TYPE JSONB USING helpful_aspects::jsonb',
+        'ALTER COLUMN helpful_aspects TYPE JSON USING helpful_aspects::json'
+    ),
+    (
+        'ALTER COLUMN improvement_suggestions TYPE JSONB USING improvement_suggestions::jsonb',
+        'ALTER COLUMN improvement_suggestions TYPE JSON USING improvement_suggestions::json'
+    ),
+)
+
+# Indexes added on protocol_tracking, as (index name, definition)
+PROTOCOL_TRACKING_INDEXES = (
+    # Serves "latest analyses of a given priority" as an ordered scan, no separate sort
+    ('idx_pt_priority_date', 'USING btree (ai_upgrade_priority, ai_analysis_date DESC)'),
+    # Rows are analysed shortly after they are appended, so analysis dates follow heap order and a
+    # BRIN index covers date range scans at a fraction of a btree's size
+    ('idx_pt_ai_analysis_date_brin', 'USING BRIN (ai_analysis_date) WITH (pages_per_range = 32)'),
+    # The default array_ops GIN serves @> and && on the change lists
+    ('idx_pt_ai_key_changes_gin', 'USING GIN (ai_key_changes)'),
+    ('idx_pt_ai_breaking_changes_gin', 'USING GIN (ai_breaking_changes)'),
+    # jsonb_path_ops only serves @>, which is how security updates are searched
+    ('idx_pt_ai_security_updates_gin', 'USING GIN (ai_security_updates jsonb_path_ops)'),
+)
+
+# Rows per ai_provider_id backfill transaction
+BACKFILL_BATCH_SIZE = 1000
+
+BACKFILL_AI_PROVIDER_ID = """
+    UPDATE protocol_tracking pt SET ai_provider_id = p.id
+    FROM ai_providers p WHERE p.name = pt.ai_provider
+"""
+
+# Backfills the next page of rows after :last_id and returns the last id it covered, NULL once
+# the table is exhausted
+BACKFILL_AI_PROVIDER_ID_PAGE = sa.text("""
+    WITH page AS (
+        SELECT id FROM protocol_tracking WHERE id > :last_id ORDER BY id LIMIT :batch_size
+    ), backfilled AS (
+        UPDATE protocol_tracking pt SET ai_provider_id = p.id
+        FROM page, ai_providers p
+        WHERE pt.id = page.id AND p.name = pt.ai_provider
+    )
+    SELECT max(id) FROM page
+""")
+
+# Single-column indexes from a1b2c3d4e5f6 superseded by the ones above, as (index name, column)
+REPLACED_INDEXES = (
+    ('idx_protocol_tracking_ai_analysis_date', 'ai_analysis_date'),
+    ('idx_protocol_tracking_upgrade_priority', 'ai_upgrade_priority'),
+)
+
+
+def upgrade() -> None:
+    # The type changes rewrite protocol_tracking and every index on it, drop the superseded
+    # indexes first so they are not rebuilt just to be thrown away
+    for name, _ in REPLACED_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    AI_UPGRADE_PRIORITY.create(op.get_bind(), checkfirst=True)
+    op.execute(JSON_TO_TEXT_ARRAY)
+
+    op.create_table('ai_providers',
+    sa.Column('id', sa.SmallInteger(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.execute(
+        "INSERT INTO ai_providers (name) "
+        "SELECT DISTINCT ai_provider FROM protocol_tracking WHERE ai_provider IS NOT NULL"
+    )
+
+    # One ALTER TABLE per table, a single lock, rewrite and catalog update
+    op.execute(
+        "ALTER TABLE protocol_tracking "
+        + ", ".join(clause for clause, _ in PROTOCOL_TRACKING_ALTERATIONS)
+    )
+    op.execute(
+        "ALTER TABLE ai_analysis_feedback "
+        + ", ".join(clause for clause, _ in FEEDBACK_ALTERATIONS)
+    )
+
+    # Backfill in keyset pages, each committed on its own, so row locks on protocol_tracking are
+    # held for one page at a time rather than for the whole table
+    with op.get_context().autocommit_block():
+        if op.get_context().as_sql:
+            op.execute(BACKFILL_AI_PROVIDER_ID)
+        else:
+            last_id = 0
+            while last_id is not None:
+                last_id = op.get_bind().execute(
+                    BACKFILL_AI_PROVIDER_ID_PAGE,
+                    {'last_id': last_id, 'batch_size': BACKFILL_BATCH_SIZE}
+                ).scalar()
+    op.drop_column('protocol_tracking', 'ai_provider')
+
+    # Index without blocking writes, CONCURRENTLY cannot run in a transaction
+    with op.get_context().autocommit_block():
+        for name, definition in PROTOCOL_TRACKING_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON protocol_tracking {definition}")
+
+
+def downgrade() -> None:
+    # The GIN indexes have no operator class for plain JSON, drop them before the types revert
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(PROTOCOL_TRACKING_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+    op.add_column('protocol_tracking', sa.Column('ai_provider', sa.String(length=50), nullable=True))
+    op.execute(
+        "UPDATE protocol_tracking pt SET ai_provider = p.name "
+        "FROM ai_providers p WHERE p.id = pt.ai_provider_id"
+    )
+
+    op.execute(
+        "ALTER TABLE ai_analysis_feedback "
+        + ", ".join(clause for _, clause in reversed(FEEDBACK_ALTERATIONS))
+    )
+    op.execute(
+        "ALTER TABLE protocol_tracking "
+        + ", ".join(clause for _, clause in reversed(PROTOCOL_TRACKING_ALTERATIONS))
+    )
+    op.drop_table('ai_providers')
+    AI_UPGRADE_PRIORITY.drop(op.get_bind(), checkfirst=True)
+
+    with op.get_context().autocommit_block():
+        for name, column in REPLACED_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON protocol_tracking ({column})")
@@ -0,0 +1,39 @@
+"""Seed protocol snapshot prefixes from protocols
+
+Revision ID: d3a8b6e1f572
+Revises: c7e1f4a9b203
+Create Date: 2026-10-15 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a8b6e1f572'
+down_revision: Union[str, None] = 'c7e1f4a9b203'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Seed one prefix per protocol from the legacy single-prefix column, in one server-side statement.
+    # Protocols that already have prefixes are left alone, they no longer fall back to snapshot_prefix
+    # and adding it would change what gets scanned
+    op.execute(sa.text("""
+        INSERT INTO protocol_snapshot_prefixes (protocol_id, prefix, is_active, created_at, updated_at)
+        SELECT id, snapshot_prefix, true, now(), now()
+        FROM protocols
+        WHERE snapshot_prefix IS NOT NULL
+          AND NOT EXISTS (
+              SELECT 1 FROM protocol_snapshot_prefixes p WHERE p.protocol_id = protocols.id
+          )
+        ON CONFLICT (protocol_id, prefix) DO NOTHING
+    """))
+
+
+def downgrade() -> None:
+    # Seeded rows cannot be told apart from prefixes added since, leave them in place
+    pass